@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import queue
+import re
 import threading
 import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog, ttk
 from typing import List, Optional, Tuple
 
-from .model import Puzzle, UNKNOWN, EMPTY, FILLED
+from .model import Puzzle, EMPTY, FILLED, UNKNOWN_BYTE, flatten_grid, unflatten_grid
 from .solver import propagate_once, solve_nonogram
 
 
+# One C-level scan tokenizes a clue string; the fullmatch guard keeps the
+# old behavior of rejecting anything but digits, dots and whitespace.
+_CLUE_RE = re.compile(r"\d+")
+_CLUE_TEXT_RE = re.compile(r"[\d.\s]*\Z")
+
+
 class NonogramApp(tk.Tk):
+    _COLOR_MAP = {FILLED: "#000000", EMPTY: "#ffffff", UNKNOWN_BYTE: "#dddddd"}
+
     def __init__(self) -> None:
         super().__init__()
         self.title("Nonogram Solver")
@@ -23,17 +32,33 @@ class NonogramApp(tk.Tk):
 
         self.row_clues: List[List[int]] = [[] for _ in range(self.height)]
         self.col_clues: List[List[int]] = [[] for _ in range(self.width)]
-        self.grid: List[List[int]] = [[UNKNOWN for _ in range(self.width)] for _ in range(self.height)]
+        self.grid: bytearray = bytearray([UNKNOWN_BYTE]) * (self.width * self.height)
+        self._displayed_grid: bytearray = bytearray(self.grid)
+        self._culled_range: Tuple[int, int, int, int] = (0, self.height - 1, 0, self.width - 1)
+        self._log_buffer: List[str] = []
+        self._log_flush_pending = False
+        self._grid_scroll_x = 0
+        self._grid_scroll_y = 0
+        self._resize_after_id: Optional[str] = None
+        self._bg_image: Optional[tk.PhotoImage] = None
+        self._bg_item: Optional[int] = None
+        self._bg_key: Tuple[int, int, int] = (0, 0, 0)
+        self._row_hint_bg: Optional[tk.PhotoImage] = None
+        self._col_hint_bg: Optional[tk.PhotoImage] = None
+        self._hint_bg_key: Tuple[int, int, int, int, int] = (0, 0, 0, 0, 0)
 
         self.stop_event = threading.Event()
         self.solve_thread: Optional[threading.Thread] = None
         self.queue: queue.Queue = queue.Queue()
 
+        self._poll_delay = 200
+        self._rebuild_hint_text()
+
         self._build_ui()
         self._update_hint_sizes()
         self._redraw_hints()
         self._redraw_grid()
-        self.after(100, self._process_queue)
+        self.after(self._poll_delay, self._process_queue)
 
     def _build_ui(self) -> None:
         toolbar = ttk.Frame(self)
@@ -79,6 +104,7 @@ class NonogramApp(tk.Tk):
         self.grid_canvas.bind("<Button-1>", self._on_left_click)
         self.grid_canvas.bind("<Button-3>", self._on_right_click)
         self.grid_canvas.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.grid_canvas.bind("<Configure>", self._on_grid_configure)
 
         log_frame = ttk.Frame(main)
         log_frame.grid(row=0, column=2, rowspan=2, sticky="nsew")
@@ -103,6 +129,45 @@ class NonogramApp(tk.Tk):
         self.row_hint_canvas.configure(width=row_hint_width, height=self.height * self.cell_size)
         self.col_hint_canvas.configure(width=self.width * self.cell_size, height=col_hint_height)
 
+    def _visible_cells(self) -> Tuple[int, int, int, int]:
+        # Rows/columns intersecting the visible canvas area, with a 64-px
+        # buffer so small resizes do not force an immediate re-cull. Before
+        # the window is mapped winfo_* report 1x1; show everything then.
+        view_w = self.grid_canvas.winfo_width()
+        view_h = self.grid_canvas.winfo_height()
+        if view_w <= 1 or view_h <= 1:
+            return 0, self.height - 1, 0, self.width - 1
+        r1 = min(self.height - 1, (view_h + 64) // self.cell_size)
+        c1 = min(self.width - 1, (view_w + 64) // self.cell_size)
+        return 0, r1, 0, c1
+
+    def _on_grid_configure(self, event) -> None:
+        if self._visible_cells() != self._culled_range:
+            self._redraw_grid()
+
+    def _ensure_hint_images(self, row_width: int, col_height: int) -> None:
+        # The faint guide lines are static per geometry; stamp them into one
+        # PhotoImage per hint canvas instead of W+H individual line items.
+        key = (self.width, self.height, self.cell_size, row_width, col_height)
+        if key == self._hint_bg_key and self._row_hint_bg is not None:
+            return
+        row_h = self.height * self.cell_size
+        img = tk.PhotoImage(width=row_width, height=row_h)
+        img.put("#ffffff", to=(0, 0, row_width, row_h))
+        for r in range(self.height):
+            y = min(r * self.cell_size, row_h - 1)
+            img.put("#e0e0e0", to=(0, y, row_width, y + 1))
+        self._row_hint_bg = img
+
+        col_w = self.width * self.cell_size
+        img = tk.PhotoImage(width=col_w, height=col_height)
+        img.put("#ffffff", to=(0, 0, col_w, col_height))
+        for c in range(self.width):
+            x = min(c * self.cell_size, col_w - 1)
+            img.put("#e0e0e0", to=(x, 0, x + 1, col_height))
+        self._col_hint_bg = img
+        self._hint_bg_key = key
+
     def _redraw_hints(self) -> None:
         self.row_hint_canvas.delete("all")
         self.col_hint_canvas.delete("all")
@@ -110,74 +175,151 @@ class NonogramApp(tk.Tk):
         row_width = int(self.row_hint_canvas.cget("width"))
         col_height = int(self.col_hint_canvas.cget("height"))
 
-        for r in range(self.height):
-            y = r * self.cell_size
-            self.row_hint_canvas.create_line(0, y, row_width, y, fill="#e0e0e0")
-        for c in range(self.width):
-            x = c * self.cell_size
-            self.col_hint_canvas.create_line(x, 0, x, col_height, fill="#e0e0e0")
+        r0, r1, c0, c1 = self._visible_cells()
 
-        for r in range(self.height):
-            text = " ".join(str(n) for n in self.row_clues[r])
+        self._ensure_hint_images(row_width, col_height)
+        self.row_hint_canvas.create_image(0, 0, anchor="nw", image=self._row_hint_bg)
+        self.col_hint_canvas.create_image(0, 0, anchor="nw", image=self._col_hint_bg)
+
+        for r in range(r0, r1 + 1):
             y = r * self.cell_size + self.cell_size / 2
             self.row_hint_canvas.create_text(
                 row_width - 6,
                 y,
-                text=text,
+                text=self._row_hint_text[r],
                 anchor="e",
             )
 
-        for c in range(self.width):
-            text = "\n".join(str(n) for n in self.col_clues[c])
+        for c in range(c0, c1 + 1):
             x = c * self.cell_size + self.cell_size / 2
             self.col_hint_canvas.create_text(
                 x,
                 col_height - 6,
-                text=text,
+                text=self._col_hint_text[c],
                 anchor="s",
             )
 
+    def _rebuild_hint_text(self) -> None:
+        # Hint strings only change when clues are edited or a puzzle is
+        # loaded, not on every repaint or cell-size change; cache them.
+        self._row_hint_text = [" ".join(str(n) for n in line) for line in self.row_clues]
+        self._col_hint_text = ["\n".join(str(n) for n in line) for line in self.col_clues]
+
+    def _ensure_static_layer(self) -> None:
+        # The grid lines and the unknown-cell background never change while
+        # cells are filled in, so they live on a separate "static" layer
+        # below the "cells" layer: one PhotoImage item, rebuilt only when
+        # the geometry changes. Tk cannot stack transparent canvases, so the
+        # two layers are tags on the one canvas.
+        key = (self.width, self.height, self.cell_size)
+        if key == self._bg_key and self._bg_item is not None:
+            return
+        w = self.width * self.cell_size
+        h = self.height * self.cell_size
+        img = tk.PhotoImage(width=w, height=h)
+        img.put(self._COLOR_MAP[UNKNOWN_BYTE], to=(0, 0, w, h))
+        for c in range(self.width + 1):
+            x = min(c * self.cell_size, w - 1)
+            img.put("#888888", to=(x, 0, x + 1, h))
+        for r in range(self.height + 1):
+            y = min(r * self.cell_size, h - 1)
+            img.put("#888888", to=(0, y, w, y + 1))
+        self.grid_canvas.delete("static")
+        self._bg_image = img
+        self._bg_item = self.grid_canvas.create_image(0, 0, anchor="nw", image=img, tags=("static",))
+        self.grid_canvas.tag_lower("static")
+        self._bg_key = key
+
+    def _make_cell_item(self, i: int, v: int) -> int:
+        r, c = divmod(i, self.width)
+        x0 = c * self.cell_size
+        y0 = r * self.cell_size
+        return self.grid_canvas.create_rectangle(
+            x0, y0, x0 + self.cell_size, y0 + self.cell_size,
+            outline="#888888", fill=self._COLOR_MAP[v], tags=("cells",),
+        )
+
     def _redraw_grid(self) -> None:
-        self.grid_canvas.delete("all")
-        self.cell_items: List[List[int]] = []
-        for r in range(self.height):
-            row_items = []
-            for c in range(self.width):
-                x0 = c * self.cell_size
-                y0 = r * self.cell_size
-                x1 = x0 + self.cell_size
-                y1 = y0 + self.cell_size
-                item = self.grid_canvas.create_rectangle(
-                    x0, y0, x1, y1, outline="#888888", fill=self._color_for(self.grid[r][c])
-                )
-                row_items.append(item)
-            self.cell_items.append(row_items)
+        self.grid_canvas.delete("cells")
+        self.cell_items: dict = {}
+        self._ensure_static_layer()
+        r0, r1, c0, c1 = self._visible_cells()
+        self._culled_range = (r0, r1, c0, c1)
+        for r in range(r0, r1 + 1):
+            base = r * self.width
+            for c in range(c0, c1 + 1):
+                v = self.grid[base + c]
+                if v != UNKNOWN_BYTE:
+                    self.cell_items[base + c] = self._make_cell_item(base + c, v)
+        self._displayed_grid = bytearray(self.grid)
         self.grid_canvas.configure(scrollregion=(0, 0, self.width * self.cell_size, self.height * self.cell_size))
         self._update_hint_sizes()
         self._redraw_hints()
 
-    def _color_for(self, v: int) -> str:
-        if v == FILLED:
-            return "#000000"
-        if v == EMPTY:
-            return "#ffffff"
-        return "#dddddd"
-
     def _set_cell(self, r: int, c: int, v: int) -> None:
-        self.grid[r][c] = v
-        self.grid_canvas.itemconfig(self.cell_items[r][c], fill=self._color_for(v))
+        i = r * self.width + c
+        if self.grid[i] == v:
+            return
+        self.grid[i] = v
+        self._displayed_grid[i] = v
+        item = self.cell_items.get(i)
+        if v == UNKNOWN_BYTE:
+            if item is not None:
+                self.grid_canvas.delete(item)
+                del self.cell_items[i]
+        elif item is not None:
+            self.grid_canvas.itemconfig(item, fill=self._COLOR_MAP[v])
+        elif self._cell_visible(i):
+            self.cell_items[i] = self._make_cell_item(i, v)
+
+    def _cell_visible(self, i: int) -> bool:
+        r, c = divmod(i, self.width)
+        r0, r1, c0, c1 = self._culled_range
+        return r0 <= r <= r1 and c0 <= c <= c1
+
+    def _sync_grid_to_canvas(self) -> None:
+        # Repaint only cells whose value differs from what the canvas shows.
+        # Updates are collected first and issued grouped by color so Tk can
+        # coalesce the damage into a single redraw at the update_idletasks
+        # call below instead of scheduling one repaint per itemconfig.
+        if self.grid == self._displayed_grid:
+            return
+        pending: List[Tuple[str, int]] = []
+        items = self.cell_items
+        dirty = False
+        for i, v in enumerate(self.grid):
+            if v != self._displayed_grid[i]:
+                self._displayed_grid[i] = v
+                item = items.get(i)
+                if v == UNKNOWN_BYTE:
+                    if item is not None:
+                        self.grid_canvas.delete(item)
+                        del items[i]
+                        dirty = True
+                elif item is not None:
+                    pending.append((self._COLOR_MAP[v], item))
+                elif self._cell_visible(i):
+                    items[i] = self._make_cell_item(i, v)
+                    dirty = True
+        if not pending and not dirty:
+            return
+        pending.sort()
+        itemconfig = self.grid_canvas.itemconfig
+        for color, item in pending:
+            itemconfig(item, fill=color)
+        self.grid_canvas.update_idletasks()
 
     def _on_left_click(self, event) -> None:
         r, c = self._event_to_cell(event)
         if r is None:
             return
-        cur = self.grid[r][c]
-        if cur == UNKNOWN:
+        cur = self.grid[r * self.width + c]
+        if cur == UNKNOWN_BYTE:
             self._set_cell(r, c, FILLED)
         elif cur == FILLED:
             self._set_cell(r, c, EMPTY)
         else:
-            self._set_cell(r, c, UNKNOWN)
+            self._set_cell(r, c, UNKNOWN_BYTE)
 
     def _on_right_click(self, event) -> None:
         r, c = self._event_to_cell(event)
@@ -186,10 +328,11 @@ class NonogramApp(tk.Tk):
         self._set_cell(r, c, EMPTY)
 
     def _event_to_cell(self, event) -> Tuple[Optional[int], Optional[int]]:
-        x = self.grid_canvas.canvasx(event.x)
-        y = self.grid_canvas.canvasy(event.y)
-        c = int(x // self.cell_size)
-        r = int(y // self.cell_size)
+        # canvasx/canvasy round-trip through the Tk interpreter per call;
+        # the canvas is never scrolled, so cached offsets (always 0 today)
+        # plus plain widget coordinates give the same answer.
+        c = (event.x + self._grid_scroll_x) // self.cell_size
+        r = (event.y + self._grid_scroll_y) // self.cell_size
         if 0 <= r < self.height and 0 <= c < self.width:
             return r, c
         return None, None
@@ -209,20 +352,26 @@ class NonogramApp(tk.Tk):
         self._set_cell_size(new_size)
 
     def _set_cell_size(self, size: int) -> None:
+        # Rapid wheel ticks or scale drags would otherwise trigger a full
+        # canvas rebuild per event; debounce so only the final size repaints.
         if size == self.cell_size:
             return
         self.cell_size = size
         self.cell_var.set(size)
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(40, self._apply_pending_size)
+
+    def _apply_pending_size(self) -> None:
+        self._resize_after_id = None
         self._update_hint_sizes()
         self._redraw_hints()
         self._redraw_grid()
 
     def _parse_clue_text(self, text: str) -> List[int]:
-        text = text.strip()
-        if not text:
-            return []
-        parts = [p.strip() for p in text.split(".") if p.strip()]
-        nums = [int(x) for x in parts]
+        if not _CLUE_TEXT_RE.match(text):
+            raise ValueError("clues must be positive integers")
+        nums = [int(m) for m in _CLUE_RE.findall(text)]
         if any(n <= 0 for n in nums):
             raise ValueError("clues must be positive integers")
         return nums
@@ -249,7 +398,8 @@ class NonogramApp(tk.Tk):
         self.width, self.height = result
         self.row_clues = [[] for _ in range(self.height)]
         self.col_clues = [[] for _ in range(self.width)]
-        self.grid = [[UNKNOWN for _ in range(self.width)] for _ in range(self.height)]
+        self.grid = bytearray([UNKNOWN_BYTE]) * (self.width * self.height)
+        self._rebuild_hint_text()
         self._update_hint_sizes()
         self._redraw_hints()
         self._redraw_grid()
@@ -268,7 +418,8 @@ class NonogramApp(tk.Tk):
             self.height = puzzle.height
             self.row_clues = puzzle.row_clues
             self.col_clues = puzzle.col_clues
-            self.grid = puzzle.grid
+            self.grid = bytearray(puzzle.grid)
+            self._rebuild_hint_text()
             self._update_hint_sizes()
             self._redraw_hints()
             self._redraw_grid()
@@ -288,17 +439,16 @@ class NonogramApp(tk.Tk):
                 height=self.height,
                 row_clues=self.row_clues,
                 col_clues=self.col_clues,
-                grid=self.grid,
+                grid=bytearray(self.grid),
             )
-            puzzle.save_json(path)
+            puzzle.save_json(path, pretty=True)
             self.log(f"Saved {path}")
         except Exception as exc:
             messagebox.showerror("Save Error", str(exc))
 
     def reset_grid(self) -> None:
-        for r in range(self.height):
-            for c in range(self.width):
-                self._set_cell(r, c, UNKNOWN)
+        self.grid[:] = bytes([UNKNOWN_BYTE]) * len(self.grid)
+        self._sync_grid_to_canvas()
         self.log("Grid reset")
 
     def solve_puzzle(self) -> None:
@@ -310,15 +460,26 @@ class NonogramApp(tk.Tk):
 
         self.stop_event.clear()
         self.log("Solving...")
+        # Hand the worker an immutable snapshot -- one memcpy on the UI
+        # thread; expanding to solver row lists happens off the UI thread.
+        grid_bytes = bytes(self.grid)
+        width = self.width
 
         def run() -> None:
             start = time.time()
+            grid_rows = unflatten_grid(grid_bytes, width)
+            last_progress = [0.0]
 
             def progress_cb(stage, stats):
-                self.queue.put(("progress", stage, stats))
+                # A fast solve can emit thousands of progress events per
+                # second; forward at most ~20/s and drop the rest.
+                now = time.monotonic()
+                if now - last_progress[0] > 0.05:
+                    last_progress[0] = now
+                    self.queue.put(("progress", stage, stats))
 
             result = solve_nonogram(
-                [row[:] for row in self.grid],
+                grid_rows,
                 self.row_clues,
                 self.col_clues,
                 stop_event=self.stop_event,
@@ -338,7 +499,8 @@ class NonogramApp(tk.Tk):
     def step_puzzle(self) -> None:
         if not self._parse_clues():
             return
-        ok, changed = propagate_once(self.grid, self.row_clues, self.col_clues)
+        grid_rows = unflatten_grid(bytes(self.grid), self.width)
+        ok, changed = propagate_once(grid_rows, self.row_clues, self.col_clues)
         if not ok:
             self.log("Contradiction in step")
             messagebox.showerror("Step", "Contradiction detected")
@@ -346,17 +508,15 @@ class NonogramApp(tk.Tk):
         if changed == 0:
             self.log("No changes in step")
         else:
+            self.grid = flatten_grid(grid_rows)
             self.log(f"Step applied, changed {changed} cells")
-            for r in range(self.height):
-                for c in range(self.width):
-                    self.grid_canvas.itemconfig(
-                        self.cell_items[r][c],
-                        fill=self._color_for(self.grid[r][c]),
-                    )
+            self._sync_grid_to_canvas()
 
     def _process_queue(self) -> None:
         try:
-            while True:
+            # Cap one drain so a solver burst cannot monopolize the UI tick;
+            # leftovers are picked up on the next poll.
+            for _ in range(200):
                 item = self.queue.get_nowait()
                 if item[0] == "progress":
                     stage, stats = item[1], item[2]
@@ -378,22 +538,35 @@ class NonogramApp(tk.Tk):
                         messagebox.showinfo("Solve", "Solved (unique)")
         except queue.Empty:
             pass
-        self.after(100, self._process_queue)
+        # Poll fast only while a solve is running; idle polling at 5 Hz is
+        # plenty and keeps the event loop quiet.
+        if self.solve_thread and self.solve_thread.is_alive():
+            self._poll_delay = 30
+        else:
+            self._poll_delay = 200
+        self.after(self._poll_delay, self._process_queue)
 
     def _apply_solution(self, solution: List[List[int]]) -> None:
-        self.grid = [row[:] for row in solution]
-        for r in range(self.height):
-            for c in range(self.width):
-                self.grid_canvas.itemconfig(
-                    self.cell_items[r][c],
-                    fill=self._color_for(self.grid[r][c]),
-                )
+        self.grid = flatten_grid(solution)
+        self._sync_grid_to_canvas()
 
     def log(self, msg: str) -> None:
+        # Four Tk calls per message add up when the solver reports progress;
+        # buffer lines and flush them with one insert on the next idle tick.
+        self._log_buffer.append(msg + "\n")
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.after_idle(self._flush_log)
+
+    def _flush_log(self) -> None:
+        self._log_flush_pending = False
+        if not self._log_buffer:
+            return
         self.log_text.configure(state=tk.NORMAL)
-        self.log_text.insert(tk.END, msg + "\n")
+        self.log_text.insert(tk.END, "".join(self._log_buffer))
         self.log_text.see(tk.END)
         self.log_text.configure(state=tk.DISABLED)
+        self._log_buffer.clear()
 
     def _on_edit_row_hint(self, event) -> None:
         y = self.row_hint_canvas.canvasy(event.y)
@@ -406,6 +579,7 @@ class NonogramApp(tk.Tk):
             return
         try:
             self.row_clues[r] = self._parse_clue_text(text)
+            self._row_hint_text[r] = " ".join(str(n) for n in self.row_clues[r])
             self._redraw_hints()
         except Exception as exc:
             messagebox.showerror("Input Error", str(exc))
@@ -421,6 +595,7 @@ class NonogramApp(tk.Tk):
             return
         try:
             self.col_clues[c] = self._parse_clue_text(text)
+            self._col_hint_text[c] = "\n".join(str(n) for n in self.col_clues[c])
             self._redraw_hints()
         except Exception as exc:
             messagebox.showerror("Input Error", str(exc))
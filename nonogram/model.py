@@ -2,12 +2,39 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import json
+from pathlib import Path
 from typing import List
 
 UNKNOWN = -1
 EMPTY = 0
 FILLED = 1
 
+# The grid is stored as a flat bytearray (row-major, index r*width+c) so a
+# cell costs one byte instead of a boxed int, and copies are single memcpys.
+# A bytearray cannot hold -1, so UNKNOWN is encoded as 2; EMPTY and FILLED
+# keep their values.
+UNKNOWN_BYTE = 2
+
+_TO_BYTE = {UNKNOWN: UNKNOWN_BYTE, EMPTY: EMPTY, FILLED: FILLED}
+_FROM_BYTE = (EMPTY, FILLED, UNKNOWN)
+_VALID_BYTES = bytes((EMPTY, FILLED, UNKNOWN_BYTE))
+
+
+def flatten_grid(rows: List[List[int]]) -> bytearray:
+    """Convert a nested list of -1/0/1 cells into the flat byte encoding."""
+    try:
+        return bytearray(_TO_BYTE[v] for row in rows for v in row)
+    except (KeyError, TypeError):
+        raise ValueError("grid contains invalid value")
+
+
+def unflatten_grid(buf: bytes, width: int) -> List[List[int]]:
+    """Convert a flat byte-encoded grid back into nested -1/0/1 lists."""
+    return [
+        [_FROM_BYTE[b] for b in buf[i : i + width]]
+        for i in range(0, len(buf), width)
+    ]
+
 
 @dataclass
 class Puzzle:
@@ -15,7 +42,7 @@ class Puzzle:
     height: int
     row_clues: List[List[int]] = field(default_factory=list)
     col_clues: List[List[int]] = field(default_factory=list)
-    grid: List[List[int]] = field(default_factory=list)
+    grid: bytearray = field(default_factory=bytearray)
 
     def __post_init__(self) -> None:
         if self.width <= 0 or self.height <= 0:
@@ -25,7 +52,9 @@ class Puzzle:
         if not self.col_clues:
             self.col_clues = [[] for _ in range(self.width)]
         if not self.grid:
-            self.grid = [[UNKNOWN for _ in range(self.width)] for _ in range(self.height)]
+            self.grid = bytearray([UNKNOWN_BYTE]) * (self.width * self.height)
+        elif isinstance(self.grid, list):
+            self.grid = flatten_grid(self.grid)
         self._validate()
 
     def _validate(self) -> None:
@@ -33,14 +62,21 @@ class Puzzle:
             raise ValueError("row_clues length mismatch")
         if len(self.col_clues) != self.width:
             raise ValueError("col_clues length mismatch")
-        if len(self.grid) != self.height:
-            raise ValueError("grid height mismatch")
-        for row in self.grid:
-            if len(row) != self.width:
-                raise ValueError("grid width mismatch")
-            for v in row:
-                if v not in (UNKNOWN, EMPTY, FILLED):
-                    raise ValueError("grid contains invalid value")
+        if len(self.grid) != self.width * self.height:
+            raise ValueError("grid size mismatch")
+        # Deleting the three legal byte values leaves only illegal ones;
+        # translate() runs the whole scan in C instead of a per-cell loop.
+        if self.grid.translate(None, delete=_VALID_BYTES):
+            raise ValueError("grid contains invalid value")
+
+    def cell(self, r: int, c: int) -> int:
+        return _FROM_BYTE[self.grid[r * self.width + c]]
+
+    def set_cell(self, r: int, c: int, v: int) -> None:
+        try:
+            self.grid[r * self.width + c] = _TO_BYTE[v]
+        except KeyError:
+            raise ValueError("grid contains invalid value")
 
     @staticmethod
     def _normalize_clues(clues: List[List[int]]) -> List[List[int]]:
@@ -63,18 +99,23 @@ class Puzzle:
             "height": self.height,
             "row_clues": self.row_clues,
             "col_clues": self.col_clues,
-            "grid": self.grid,
+            "grid": unflatten_grid(self.grid, self.width),
         }
 
-    def save_json(self, path: str) -> None:
+    def save_json(self, path: str, pretty: bool = False) -> None:
         data = self.to_dict()
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+            if pretty:
+                json.dump(data, f, indent=2)
+            else:
+                # Compact output skips per-element indentation formatting --
+                # noticeably cheaper for frequent or scripted saves.
+                json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
 
     @classmethod
     def load_json(cls, path: str) -> "Puzzle":
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Hand the C parser one contiguous buffer instead of a file object.
+        data = json.loads(Path(path).read_bytes())
 
         width = int(data.get("width", 0))
         height = int(data.get("height", 0))
@@ -82,8 +123,17 @@ class Puzzle:
         col_clues = cls._normalize_clues(data.get("col_clues", []))
         grid = data.get("grid", [])
 
+        # Normalize to the flat byte form right at parse time: one shape
+        # check plus one comprehension, so construction below validates a
+        # bytearray instead of re-walking nested lists.
         if not isinstance(grid, list) or not grid:
-            grid = [[UNKNOWN for _ in range(width)] for _ in range(height)]
+            grid = bytearray([UNKNOWN_BYTE]) * (width * height)
+        else:
+            if len(grid) != height or any(
+                not isinstance(row, list) or len(row) != width for row in grid
+            ):
+                raise ValueError("grid shape mismatch")
+            grid = flatten_grid(grid)
 
         return cls(
             width=width,
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, wait
+from math import comb
 from dataclasses import dataclass
-from functools import lru_cache
-from typing import Callable, List, Optional, Tuple
+from functools import lru_cache, reduce
+from multiprocessing import Manager
+from operator import and_, or_
+from time import monotonic
+from typing import Callable, List, Optional, Sequence, Tuple
 
 UNKNOWN = -1
 EMPTY = 0
 FILLED = 1
 
+# Upper bound on remembered dead-end board states per solve (see
+# solve_nonogram); oldest entries are evicted first.
+_NOGOOD_CAP = 100000
+
 
 class Cancelled(Exception):
     pass
@@ -34,223 +46,841 @@ def _check_cancel(stop_event) -> None:
         raise Cancelled()
 
 
-@lru_cache(maxsize=20000)
-def _line_candidates(
-    length: int, blocks: Tuple[int, ...], line_state: Tuple[int, ...]
-) -> Tuple[Tuple[int, ...], ...]:
-    # Generate all line patterns that match blocks and current line_state.
+# The enumeration kernels sit behind lru_cache wrappers, so a stop event
+# cannot be threaded through them as an argument without poisoning the
+# cache keys; the active solve registers it here instead. The slot is
+# thread-local so a set event only ever cancels work on the thread that
+# registered it -- a GUI Step on the main thread must not trip over the
+# stop event of a solve unwinding on its worker thread. Event.is_set()
+# acquires a lock -- and is a proxy round-trip for parallel workers -- so
+# hot loops poll it only every 1024th tick.
+_cancel_state = threading.local()
+
+
+def _tick_cancel() -> None:
+    ticks = getattr(_cancel_state, "ticks", 0) + 1
+    _cancel_state.ticks = ticks
+    if ticks & 1023:
+        return
+    event = getattr(_cancel_state, "event", None)
+    if event is not None and event.is_set():
+        raise Cancelled()
+
+
+def _pack_state(line_state: Sequence[int]) -> Tuple[int, int]:
+    # Pack a tri-state line into two bitmasks: bit i of filled/empty set
+    # when cell i is known FILLED/EMPTY.
+    filled = 0
+    empty = 0
+    bit = 1
+    for v in line_state:
+        if v == FILLED:
+            filled |= bit
+        elif v == EMPTY:
+            empty |= bit
+        bit <<= 1
+    return filled, empty
+
+
+# Clue tuples interned as small ints. The cached line solvers key on
+# (length, blocks_key, filled, empty) -- four plain ints -- so every
+# lru_cache lookup hashes O(1) data instead of re-hashing the blocks tuple
+# element-wise. The table only ever grows by distinct clue sets seen.
+_blocks_intern: dict = {}
+_blocks_by_key: List[Tuple[int, ...]] = []
+
+
+def _blocks_key(blocks: Tuple[int, ...]) -> int:
+    key = _blocks_intern.get(blocks)
+    if key is None:
+        key = len(_blocks_by_key)
+        _blocks_by_key.append(blocks)
+        _blocks_intern[blocks] = key
+    return key
+
+
+def _line_candidates_bits(
+    length: int, blocks: Tuple[int, ...], filled: int, empty: int
+) -> Tuple[int, ...]:
+    # Generate every line pattern matching blocks and the known cells, as
+    # bitmasks of the filled cells. Interior per-cell scans collapse to
+    # bitwise tests against the packed known-state masks.
     if not blocks:
-        for v in line_state:
-            if v == FILLED:
-                return tuple()
-        return (tuple(EMPTY for _ in range(length)),)
-
-    candidates: List[Tuple[int, ...]] = []
-    line = [EMPTY] * length
-
-    def place(idx: int, pos: int) -> None:
-        if idx == len(blocks):
-            for i in range(pos, length):
-                if line_state[i] == FILLED:
-                    return
-            candidates.append(tuple(line))
+        return () if filled else (0,)
+
+    nblocks = len(blocks)
+    # min_rem_len[i]: cells needed for blocks[i:] incl. separating gaps.
+    min_rem_len = [0] * (nblocks + 1)
+    for i in range(nblocks - 1, -1, -1):
+        min_rem_len[i] = min_rem_len[i + 1] + blocks[i] + (1 if i < nblocks - 1 else 0)
+
+    candidates: List[int] = []
+    # Bind everything the recursion touches to locals: the placement loop is
+    # the solver's innermost kernel, and global/attribute lookups inside it
+    # cost more than the bit arithmetic itself.
+    append = candidates.append
+    last_block = nblocks - 1
+
+    def place(idx: int, pos: int, acc: int) -> None:
+        if idx == nblocks:
+            # Everything after the last block must not be known filled.
+            if filled >> pos:
+                return
+            append(acc)
             return
 
+        _tick_cancel()
         block = blocks[idx]
-        remaining = blocks[idx + 1 :]
-        min_rem_len = sum(remaining) + max(0, len(remaining))
-        max_start = length - (block + min_rem_len)
-
+        block_bits = (1 << block) - 1
+        max_start = length - min_rem_len[idx]
         for start in range(pos, max_start + 1):
-            ok = True
-            for i in range(pos, start):
-                if line_state[i] == FILLED:
-                    ok = False
-                    break
-            if not ok:
-                continue
-            for i in range(start, start + block):
-                if line_state[i] == EMPTY:
-                    ok = False
-                    break
-            if not ok:
+            gap_mask = ((1 << start) - 1) ^ ((1 << pos) - 1)
+            if filled & gap_mask:
+                # A known-filled cell would be skipped; later starts skip
+                # it too, so stop scanning.
+                break
+            block_mask = block_bits << start
+            if empty & block_mask:
                 continue
-
-            for i in range(start, start + block):
-                line[i] = FILLED
-
-            next_pos = start + block
-            if idx < len(blocks) - 1:
-                if next_pos >= length:
-                    for i in range(start, start + block):
-                        line[i] = EMPTY
+            sep = start + block
+            if idx < last_block:
+                if filled & (1 << sep):
                     continue
-                if line_state[next_pos] == FILLED:
-                    ok = False
-                else:
-                    line[next_pos] = EMPTY
-                if ok:
-                    place(idx + 1, next_pos + 1)
-                line[next_pos] = EMPTY
+                place(idx + 1, sep + 1, acc | block_mask)
             else:
-                place(idx + 1, next_pos)
-
-            for i in range(start, start + block):
-                line[i] = EMPTY
+                place(idx + 1, sep, acc | block_mask)
 
-    place(0, 0)
+    place(0, 0, 0)
     return tuple(candidates)
 
 
-def _intersect_candidates(candidates: Tuple[Tuple[int, ...], ...]) -> List[int]:
-    if not candidates:
-        return []
-    length = len(candidates[0])
-    result = [UNKNOWN] * length
-    for i in range(length):
-        v = candidates[0][i]
-        same = True
-        for cand in candidates[1:]:
-            if cand[i] != v:
-                same = False
-                break
-        result[i] = v if same else UNKNOWN
-    return result
-
+def _line_solve_lr_pass(
+    length: int, blocks: Tuple[int, ...], filled: int, empty: int
+) -> Optional[Tuple[int, int]]:
+    """One leftmost/rightmost sweep over a line.
+
+    Computes, per block, the earliest and latest start compatible with the
+    known cells (via an O(length*blocks) feasibility table rather than full
+    enumeration). Cells in a block's self-overlap are forced FILLED; cells
+    outside every block's reachable span are forced EMPTY. Placements never
+    cross known-empty cells (the feasibility test masks them out), so gaps
+    too short for a block are excluded by construction. Returns the new
+    total (filled, empty) masks, or None when no placement exists. Sound
+    but weaker than full candidate intersection.
+    """
+    full = (1 << length) - 1
+    if not blocks:
+        return None if filled else (0, full)
+
+    nblocks = len(blocks)
+
+    # nofill_from[i]: no known-filled cell at or beyond i.
+    nofill_from = [True] * (length + 1)
+    for i in range(length - 1, -1, -1):
+        nofill_from[i] = nofill_from[i + 1] and not (filled >> i & 1)
+
+    # feas[j][i]: blocks[j:] can be placed in cells [i, length).
+    feas = [[False] * (length + 2) for _ in range(nblocks + 1)]
+    feas[nblocks][: length + 1] = nofill_from
+    for j in range(nblocks - 1, -1, -1):
+        block = blocks[j]
+        block_bits = (1 << block) - 1
+        last = j == nblocks - 1
+        row = feas[j]
+        nxt = feas[j + 1]
+        for i in range(length, -1, -1):
+            ok = False
+            if i < length and not (filled >> i & 1):
+                ok = row[i + 1]
+            if not ok:
+                end = i + block
+                if end <= length and not (empty & (block_bits << i)):
+                    if last:
+                        ok = nxt[end]
+                    elif end < length and not (filled >> end & 1):
+                        ok = nxt[end + 1]
+            row[i] = ok
+
+    if not feas[0][0]:
+        return None
+
+    # Forward sweep over valid prefixes, recording the extreme feasible
+    # start of each block.
+    reach = [[False] * (length + 2) for _ in range(nblocks + 1)]
+    reach[0][0] = True
+    leftmost = [-1] * nblocks
+    rightmost = [-1] * nblocks
+    for j in range(nblocks):
+        block = blocks[j]
+        block_bits = (1 << block) - 1
+        last = j == nblocks - 1
+        row = reach[j]
+        nxt = reach[j + 1]
+        fj = feas[j]
+        for i in range(length + 1):
+            if not row[i] or not fj[i]:
+                continue
+            if i < length and not (filled >> i & 1):
+                row[i + 1] = True
+            end = i + block
+            if end <= length and not (empty & (block_bits << i)):
+                if last:
+                    placeable = nofill_from[end]
+                    target = end
+                elif end < length and not (filled >> end & 1):
+                    placeable = feas[j + 1][end + 1]
+                    target = end + 1
+                else:
+                    placeable = False
+                    target = 0
+                if placeable:
+                    nxt[target] = True
+                    if leftmost[j] < 0:
+                        leftmost[j] = i
+                    rightmost[j] = i
+
+    if any(pos < 0 for pos in leftmost):
+        return None
+
+    forced_f = filled
+    coverable = 0
+    for j, block in enumerate(blocks):
+        lo = leftmost[j]
+        hi = rightmost[j]
+        coverable |= (((1 << (hi + block - lo)) - 1) << lo)
+        if hi < lo + block:
+            # Every placement of this block covers the overlap.
+            forced_f |= (((1 << (lo + block - hi)) - 1) << hi)
+    forced_e = (full & ~coverable) | empty
+    return forced_f, forced_e
+
+
+@lru_cache(maxsize=65536)
+def _line_solve_lr(
+    length: int, blocks_key: int, filled: int, empty: int
+) -> Optional[Tuple[int, int]]:
+    """LR sweeps iterated to a fixed point within the line.
+
+    Cells forced by one sweep tighten the feasible starts for the next, so
+    re-running the sweep on its own output usually converges in two or
+    three rounds and saves board-level requeues. Still weaker than full
+    intersection on lines with disjoint placement families.
+    """
+    blocks = _blocks_by_key[blocks_key]
+    while True:
+        forced = _line_solve_lr_pass(length, blocks, filled, empty)
+        if forced is None:
+            return None
+        if forced == (filled, empty):
+            return forced
+        filled, empty = forced
+
+
+def _intersect_bits(candidates: Tuple[int, ...], length: int) -> Tuple[int, int]:
+    # Cells filled in every candidate are forced FILLED (AND-fold); cells
+    # filled in none are forced EMPTY (complement of the OR-fold). The folds
+    # are branchless, and reduce() keeps the loop itself in C; Python ints
+    # are arbitrary-width, so one fold covers lines of any length.
+    mask = (1 << length) - 1
+    return (
+        reduce(and_, candidates) & mask,
+        ~reduce(or_, candidates) & mask,
+    )
 
-def _is_solved(grid: List[List[int]]) -> bool:
-    for row in grid:
-        for v in row:
-            if v == UNKNOWN:
-                return False
-    return True
 
+# Clue sets whose unconstrained candidate count exceeds this are enumerated
+# per state instead of precomputed; beyond it the table itself (and filtering
+# all of it on every call) costs more than the pruned recursion.
+_PRECOMPUTE_LIMIT = 1 << 16
+
+
+@lru_cache(maxsize=4096)
+def _all_candidates(length: int, blocks_key: int) -> Tuple[int, ...]:
+    """Every placement of blocks on an unconstrained line, as filled-masks."""
+    return _line_candidates_bits(length, _blocks_by_key[blocks_key], 0, 0)
+
+
+def _matching_candidates(
+    length: int, blocks_key: int, filled: int, empty: int
+) -> Sequence[int]:
+    """Candidates compatible with the known cells.
+
+    The placement count for a clue set depends only on (length, blocks) --
+    C(slack + b, b) placements for b blocks with slack spare cells -- and the
+    same clue sets recur across lines and propagation passes. When that
+    count is modest, generate the full table once and filter it here with a
+    list comprehension (two bit tests per candidate, loop in C) instead of
+    re-running the placement recursion per state. Callers only read the
+    result, so an unconstrained line -- every line in the first pass of a
+    blank solve -- gets the shared table itself, not a copy.
+    """
+    blocks = _blocks_by_key[blocks_key]
+    b = len(blocks)
+    slack = length - sum(blocks) - (b - 1) if b else length
+    if b and slack >= 0 and comb(slack + b, b) <= _PRECOMPUTE_LIMIT:
+        table = _all_candidates(length, blocks_key)
+        if not (filled or empty):
+            return table
+        return [c for c in table if not (c & empty or filled & ~c)]
+    return _line_candidates_bits(length, blocks, filled, empty)
+
+
+def _single_block_forced(
+    length: int, block: int, filled: int, empty: int
+) -> Tuple[int, int, int]:
+    # One-block clue: every candidate is the same run shifted, and any
+    # known-filled cells pin the start to [top - block + 1, bottom], so the
+    # fold runs over at most length - block + 1 shifts with no recursion.
+    block_bits = (1 << block) - 1
+    lo = 0
+    hi = length - block
+    if filled:
+        lo = max(lo, filled.bit_length() - block)
+        hi = min(hi, (filled & -filled).bit_length() - 1)
+    f_and = -1
+    f_or = 0
+    count = 0
+    for s in range(lo, hi + 1):
+        m = block_bits << s
+        if empty & m:
+            continue
+        f_and &= m
+        f_or |= m
+        count += 1
+    if not count:
+        return 0, 0, 0
+    full = (1 << length) - 1
+    return (f_and | filled) & full, (~f_or | empty) & full, count
+
+
+@lru_cache(maxsize=200000)
+def _line_forced(length: int, blocks_key: int, filled: int, empty: int) -> Tuple[int, int, int]:
+    """Exact forced cells and candidate count for one line state.
+
+    Caching this (forced_filled, forced_empty, count) triple instead of the
+    candidate lists keeps entries at three ints regardless of how many
+    thousand candidates a line has; count == 0 means contradiction.
+    Clue-edge shapes -- no blocks, or a single block -- are common enough
+    to get closed-form dispatches ahead of the generic enumeration.
+    """
+    blocks = _blocks_by_key[blocks_key]
+    if not blocks:
+        return (0, 0, 0) if filled else (0, (1 << length) - 1, 1)
+    if len(blocks) == 1:
+        return _single_block_forced(length, blocks[0], filled, empty)
+    candidates = _matching_candidates(length, blocks_key, filled, empty)
+    if not candidates:
+        return 0, 0, 0
+    new_f, new_e = _intersect_bits(candidates, length)
+    return new_f, new_e, len(candidates)
+
+
+class _Board:
+    """Structure-of-arrays board state as per-line bitmasks.
+
+    row_filled[r]/row_empty[r] hold the known cells of row r (bit c = cell
+    c); col_filled[c]/col_empty[c] mirror the same cells per column (bit r =
+    cell r). Writes keep both views in step, so reading a column line state
+    is O(1) instead of gathering H cells.
+    """
+
+    __slots__ = ("height", "width", "row_filled", "row_empty", "col_filled", "col_empty", "trail", "fixed")
+
+    def __init__(
+        self,
+        height: int,
+        width: int,
+        row_filled: List[int],
+        row_empty: List[int],
+        col_filled: List[int],
+        col_empty: List[int],
+    ) -> None:
+        self.height = height
+        self.width = width
+        self.row_filled = row_filled
+        self.row_empty = row_empty
+        self.col_filled = col_filled
+        self.col_empty = col_empty
+        # Knowledge only ever grows during propagation, so undo information
+        # is just which bits each write added: (is_row, index, add_f, add_e).
+        self.trail: List[Tuple[bool, int, int, int]] = []
+        # Running count of known cells, maintained by every write and undo,
+        # so count_fixed()/is_solved() are O(1) instead of a board scan.
+        self.fixed = sum((f | e).bit_count() for f, e in zip(row_filled, row_empty))
+
+    @classmethod
+    def from_grid(cls, grid: List[List[int]]) -> "_Board":
+        height = len(grid)
+        width = len(grid[0])
+        row_filled = [0] * height
+        row_empty = [0] * height
+        col_filled = [0] * width
+        col_empty = [0] * width
+        for r, row in enumerate(grid):
+            row_filled[r], row_empty[r] = _pack_state(row)
+        # zip(*grid) is a C-level transpose; packing the column tuples
+        # directly beats redistributing row bits cell by cell.
+        for c, col in enumerate(zip(*grid)):
+            col_filled[c], col_empty[c] = _pack_state(col)
+        return cls(height, width, row_filled, row_empty, col_filled, col_empty)
+
+    def copy(self) -> "_Board":
+        return _Board(
+            self.height,
+            self.width,
+            self.row_filled[:],
+            self.row_empty[:],
+            self.col_filled[:],
+            self.col_empty[:],
+        )
 
-def _count_fixed(grid: List[List[int]]) -> int:
-    return sum(1 for row in grid for v in row if v != UNKNOWN)
+    def checkpoint(self) -> int:
+        return len(self.trail)
+
+    def rollback(self, mark: int) -> None:
+        # Hoist the per-view lists out of the bit loops; self.X inside them
+        # would re-run the attribute lookup once per undone cell.
+        trail = self.trail
+        row_filled = self.row_filled
+        row_empty = self.row_empty
+        col_filled = self.col_filled
+        col_empty = self.col_empty
+        while len(trail) > mark:
+            is_row, index, add_f, add_e = trail.pop()
+            self.fixed -= (add_f | add_e).bit_count()
+            if is_row:
+                row_filled[index] &= ~add_f
+                row_empty[index] &= ~add_e
+                clear = ~(1 << index)
+                while add_f:
+                    b = add_f & -add_f
+                    col_filled[b.bit_length() - 1] &= clear
+                    add_f ^= b
+                while add_e:
+                    b = add_e & -add_e
+                    col_empty[b.bit_length() - 1] &= clear
+                    add_e ^= b
+            else:
+                col_filled[index] &= ~add_f
+                col_empty[index] &= ~add_e
+                clear = ~(1 << index)
+                while add_f:
+                    b = add_f & -add_f
+                    row_filled[b.bit_length() - 1] &= clear
+                    add_f ^= b
+                while add_e:
+                    b = add_e & -add_e
+                    row_empty[b.bit_length() - 1] &= clear
+                    add_e ^= b
+
+    def apply_row(self, r: int, add_f: int, add_e: int) -> None:
+        self.trail.append((True, r, add_f, add_e))
+        self.fixed += (add_f | add_e).bit_count()
+        self.row_filled[r] |= add_f
+        self.row_empty[r] |= add_e
+        col_filled = self.col_filled
+        col_empty = self.col_empty
+        rbit = 1 << r
+        while add_f:
+            b = add_f & -add_f
+            col_filled[b.bit_length() - 1] |= rbit
+            add_f ^= b
+        while add_e:
+            b = add_e & -add_e
+            col_empty[b.bit_length() - 1] |= rbit
+            add_e ^= b
+
+    def apply_col(self, c: int, add_f: int, add_e: int) -> None:
+        self.trail.append((False, c, add_f, add_e))
+        self.fixed += (add_f | add_e).bit_count()
+        self.col_filled[c] |= add_f
+        self.col_empty[c] |= add_e
+        row_filled = self.row_filled
+        row_empty = self.row_empty
+        cbit = 1 << c
+        while add_f:
+            b = add_f & -add_f
+            row_filled[b.bit_length() - 1] |= cbit
+            add_f ^= b
+        while add_e:
+            b = add_e & -add_e
+            row_empty[b.bit_length() - 1] |= cbit
+            add_e ^= b
+
+    def count_fixed(self) -> int:
+        return self.fixed
+
+    def is_solved(self) -> bool:
+        return self.fixed == self.height * self.width
+
+    def to_grid(self) -> List[List[int]]:
+        grid = [[UNKNOWN] * self.width for _ in range(self.height)]
+        self.write_back(grid)
+        return grid
+
+    def write_back(self, grid: List[List[int]]) -> None:
+        for r in range(self.height):
+            row = grid[r]
+            f = self.row_filled[r]
+            e = self.row_empty[r]
+            for c in range(self.width):
+                if f >> c & 1:
+                    row[c] = FILLED
+                elif e >> c & 1:
+                    row[c] = EMPTY
+                else:
+                    row[c] = UNKNOWN
 
 
-def propagate(
-    grid: List[List[int]],
+def _propagate_board(
+    board: _Board,
     row_clues: List[List[int]],
     col_clues: List[List[int]],
     stop_event=None,
     progress_cb: Optional[Callable[[str, SolveStats], None]] = None,
+    dirty_rows: Optional[int] = None,
+    dirty_cols: Optional[int] = None,
 ) -> Tuple[bool, SolveStats]:
-    height = len(grid)
-    width = len(grid[0])
+    height = board.height
+    width = board.width
     stats = SolveStats()
 
-    changed = True
-    while changed:
+    # Worklist propagation: only lines crossing recently changed cells are
+    # re-solved, tracked as two bitsets of line indices. Fixing cells in a
+    # row only dirties the columns through those cells, and vice versa.
+    # Callers already at a fixed point seed the bitsets with just the lines
+    # they perturbed; the default is everything.
+    if dirty_rows is None:
+        dirty_rows = (1 << height) - 1
+    if dirty_cols is None:
+        dirty_cols = (1 << width) - 1
+
+    row_filled = board.row_filled
+    row_empty = board.row_empty
+    col_filled = board.col_filled
+    col_empty = board.col_empty
+    row_keys = [_blocks_key(tuple(blocks)) for blocks in row_clues]
+    col_keys = [_blocks_key(tuple(blocks)) for blocks in col_clues]
+
+    while dirty_rows or dirty_cols:
         _check_cancel(stop_event)
-        changed = False
         stats.iterations += 1
 
-        for r in range(height):
-            line_state = tuple(grid[r])
-            blocks = tuple(row_clues[r])
-            candidates = _line_candidates(width, blocks, line_state)
-            if not candidates:
+        full_row = (1 << width) - 1
+        rows = dirty_rows
+        dirty_rows = 0
+        while rows:
+            bit = rows & -rows
+            rows ^= bit
+            r = bit.bit_length() - 1
+            filled = row_filled[r]
+            empty = row_empty[r]
+            key = row_keys[r]
+            forced = _line_solve_lr(width, key, filled, empty)
+            if forced is None:
                 return False, stats
-            intersection = _intersect_candidates(candidates)
-            for c in range(width):
-                if intersection[c] != UNKNOWN and grid[r][c] != intersection[c]:
-                    grid[r][c] = intersection[c]
-                    changed = True
-
-        for c in range(width):
-            line_state = tuple(grid[r][c] for r in range(height))
-            blocks = tuple(col_clues[c])
-            candidates = _line_candidates(height, blocks, line_state)
-            if not candidates:
+            add_f = forced[0] & ~filled
+            add_e = forced[1] & ~empty
+            if add_f or add_e:
+                # The cheap pass progressed; queue the line again so the
+                # full intersection runs only once it stalls.
+                if (filled | empty | add_f | add_e) != full_row:
+                    dirty_rows |= bit
+            elif (filled | empty) != full_row:
+                new_f, new_e, count = _line_forced(width, key, filled, empty)
+                if not count:
+                    return False, stats
+                add_f = new_f & ~filled
+                add_e = new_e & ~empty
+            if add_f or add_e:
+                board.apply_row(r, add_f, add_e)
+                dirty_cols |= add_f | add_e
+
+        full_col = (1 << height) - 1
+        cols = dirty_cols
+        dirty_cols = 0
+        while cols:
+            bit = cols & -cols
+            cols ^= bit
+            c = bit.bit_length() - 1
+            filled = col_filled[c]
+            empty = col_empty[c]
+            key = col_keys[c]
+            forced = _line_solve_lr(height, key, filled, empty)
+            if forced is None:
                 return False, stats
-            intersection = _intersect_candidates(candidates)
-            for r in range(height):
-                if intersection[r] != UNKNOWN and grid[r][c] != intersection[r]:
-                    grid[r][c] = intersection[r]
-                    changed = True
-
-        stats.fixed_cells = _count_fixed(grid)
+            add_f = forced[0] & ~filled
+            add_e = forced[1] & ~empty
+            if add_f or add_e:
+                if (filled | empty | add_f | add_e) != full_col:
+                    dirty_cols |= bit
+            elif (filled | empty) != full_col:
+                new_f, new_e, count = _line_forced(height, key, filled, empty)
+                if not count:
+                    return False, stats
+                add_f = new_f & ~filled
+                add_e = new_e & ~empty
+            if add_f or add_e:
+                board.apply_col(c, add_f, add_e)
+                dirty_rows |= add_f | add_e
+
+        stats.fixed_cells = board.count_fixed()
         if progress_cb:
             progress_cb("propagate", stats)
 
     return True, stats
 
 
+def propagate(
+    grid: List[List[int]],
+    row_clues: List[List[int]],
+    col_clues: List[List[int]],
+    stop_event=None,
+    progress_cb: Optional[Callable[[str, SolveStats], None]] = None,
+) -> Tuple[bool, SolveStats]:
+    board = _Board.from_grid(grid)
+    _cancel_state.event = stop_event
+    try:
+        ok, stats = _propagate_board(board, row_clues, col_clues, stop_event, progress_cb)
+    finally:
+        _cancel_state.event = None
+    board.write_back(grid)
+    return ok, stats
+
+
 def propagate_once(
     grid: List[List[int]],
     row_clues: List[List[int]],
     col_clues: List[List[int]],
 ) -> Tuple[bool, int]:
-    height = len(grid)
-    width = len(grid[0])
+    board = _Board.from_grid(grid)
+    height = board.height
+    width = board.width
     changed_count = 0
 
     for r in range(height):
-        line_state = tuple(grid[r])
-        blocks = tuple(row_clues[r])
-        candidates = _line_candidates(width, blocks, line_state)
-        if not candidates:
+        filled = board.row_filled[r]
+        empty = board.row_empty[r]
+        new_f, new_e, count = _line_forced(width, _blocks_key(tuple(row_clues[r])), filled, empty)
+        if not count:
             return False, changed_count
-        intersection = _intersect_candidates(candidates)
-        for c in range(width):
-            if intersection[c] != UNKNOWN and grid[r][c] != intersection[c]:
-                grid[r][c] = intersection[c]
-                changed_count += 1
+        add_f = new_f & ~filled
+        add_e = new_e & ~empty
+        if add_f or add_e:
+            board.apply_row(r, add_f, add_e)
+            changed_count += (add_f | add_e).bit_count()
 
     for c in range(width):
-        line_state = tuple(grid[r][c] for r in range(height))
-        blocks = tuple(col_clues[c])
-        candidates = _line_candidates(height, blocks, line_state)
-        if not candidates:
+        filled = board.col_filled[c]
+        empty = board.col_empty[c]
+        new_f, new_e, count = _line_forced(height, _blocks_key(tuple(col_clues[c])), filled, empty)
+        if not count:
             return False, changed_count
-        intersection = _intersect_candidates(candidates)
-        for r in range(height):
-            if intersection[r] != UNKNOWN and grid[r][c] != intersection[r]:
-                grid[r][c] = intersection[r]
-                changed_count += 1
+        add_f = new_f & ~filled
+        add_e = new_e & ~empty
+        if add_f or add_e:
+            board.apply_col(c, add_f, add_e)
+            changed_count += (add_f | add_e).bit_count()
 
+    board.write_back(grid)
     return True, changed_count
 
 
 def _best_branch_line(
-    grid: List[List[int]],
+    board: _Board,
     row_clues: List[List[int]],
     col_clues: List[List[int]],
-) -> Tuple[str, int, Tuple[Tuple[int, ...], ...]]:
-    height = len(grid)
-    width = len(grid[0])
+) -> Tuple[str, int, Tuple[int, ...]]:
+    height = board.height
+    width = board.width
+    full_row = (1 << width) - 1
+    full_col = (1 << height) - 1
     best_type = ""
     best_index = -1
-    best_candidates: Tuple[Tuple[int, ...], ...] = tuple()
     best_count = 10**9
 
+    # Branch on the line with the fewest candidates. The board is at a
+    # propagation fixed point, so every incomplete line already has a
+    # cached _line_forced entry and the count is a dict hit, not an
+    # enumeration; candidates are materialized once, for the chosen line
+    # only. An incomplete line can never have fewer than two candidates
+    # (one would have forced every cell), so count == 2 is the global
+    # minimum and ends the scan immediately.
     for r in range(height):
-        if UNKNOWN not in grid[r]:
+        filled = board.row_filled[r]
+        empty = board.row_empty[r]
+        if (filled | empty) == full_row:
             continue
-        line_state = tuple(grid[r])
-        candidates = _line_candidates(width, tuple(row_clues[r]), line_state)
-        count = len(candidates)
-        if count > 1 and count < best_count:
+        count = _line_forced(width, _blocks_key(tuple(row_clues[r])), filled, empty)[2]
+        if count < best_count:
             best_count = count
             best_type = "row"
             best_index = r
-            best_candidates = candidates
+            if count == 2:
+                break
 
-    for c in range(width):
-        line_state = tuple(grid[r][c] for r in range(height))
-        if UNKNOWN not in line_state:
-            continue
-        candidates = _line_candidates(height, tuple(col_clues[c]), line_state)
-        count = len(candidates)
-        if count > 1 and count < best_count:
-            best_count = count
-            best_type = "col"
-            best_index = c
-            best_candidates = candidates
+    if best_count != 2:
+        for c in range(width):
+            filled = board.col_filled[c]
+            empty = board.col_empty[c]
+            if (filled | empty) == full_col:
+                continue
+            count = _line_forced(height, _blocks_key(tuple(col_clues[c])), filled, empty)[2]
+            if count < best_count:
+                best_count = count
+                best_type = "col"
+                best_index = c
+                if count == 2:
+                    break
+
+    if best_index < 0:
+        return "", -1, tuple()
+    if best_type == "row":
+        filled = board.row_filled[best_index]
+        candidates = _matching_candidates(
+            width, _blocks_key(tuple(row_clues[best_index])), filled,
+            board.row_empty[best_index]
+        )
+    else:
+        filled = board.col_filled[best_index]
+        candidates = _matching_candidates(
+            height, _blocks_key(tuple(col_clues[best_index])), filled,
+            board.col_empty[best_index]
+        )
+    # Try candidates closest to the already-forced cells first: they tend
+    # to confirm quickly or fail fast.
+    ordered = sorted(candidates, key=lambda cand: (cand ^ filled).bit_count())
+    return best_type, best_index, tuple(ordered)
+
+
+class _ThrottledEvent:
+    """Rate-limited view of a cross-process cancel event.
+
+    Every is_set() on a Manager proxy is an IPC round-trip, far costlier
+    than the solver steps between checks; cache the answer and re-query at
+    most every 50 ms. Once set, stays set.
+    """
+
+    __slots__ = ("_event", "_last", "_value")
+
+    def __init__(self, event) -> None:
+        self._event = event
+        self._last = 0.0
+        self._value = False
+
+    def is_set(self) -> bool:
+        if self._value:
+            return True
+        now = monotonic()
+        if now - self._last >= 0.05:
+            self._last = now
+            self._value = self._event.is_set()
+        return self._value
+
+
+def _solve_subtree(args) -> Tuple[str, List[List[List[int]]], int, int, int]:
+    # Worker-process entry: solve the subtrees of a slice of root branch
+    # candidates sequentially, honouring the shared cancel event.
+    (base_grid, line_type, index, candidates, row_clues, col_clues,
+     max_solutions, cancel) = args
+    cancel = _ThrottledEvent(cancel) if cancel is not None else None
+    width = len(base_grid[0])
+    height = len(base_grid)
+    solutions: List[List[List[int]]] = []
+    nodes = iterations = max_depth = 0
+    for cand in candidates:
+        if cancel is not None and cancel.is_set():
+            return "cancelled", solutions, nodes, iterations, max_depth
+        child = [row[:] for row in base_grid]
+        if line_type == "row":
+            for c in range(width):
+                child[index][c] = FILLED if cand >> c & 1 else EMPTY
+        else:
+            for r in range(height):
+                child[r][index] = FILLED if cand >> r & 1 else EMPTY
+        res = solve_nonogram(
+            child, row_clues, col_clues,
+            stop_event=cancel, max_solutions=max_solutions - len(solutions),
+        )
+        nodes += res.stats.nodes
+        iterations += res.stats.iterations
+        max_depth = max(max_depth, res.stats.max_depth)
+        if res.status == "cancelled":
+            return "cancelled", solutions, nodes, iterations, max_depth
+        solutions.extend(res.solutions)
+        if len(solutions) >= max_solutions:
+            break
+    return "done", solutions, nodes, iterations, max_depth
+
+
+def _solve_parallel(
+    grid: List[List[int]],
+    row_clues: List[List[int]],
+    col_clues: List[List[int]],
+    stop_event,
+    progress_cb: Optional[Callable[[str, SolveStats], None]],
+    max_solutions: int,
+    workers: int,
+) -> SolveResult:
+    stats = SolveStats()
+    board = _Board.from_grid(grid)
+    try:
+        ok, pstats = _propagate_board(board, row_clues, col_clues, stop_event, progress_cb)
+    except Cancelled:
+        return SolveResult("cancelled", [], stats, "Solve cancelled")
+    stats.nodes = 1
+    stats.iterations = pstats.iterations
+    stats.fixed_cells = board.count_fixed()
+    if not ok:
+        return SolveResult("unsolved", [], stats, "No solution")
+    if board.is_solved():
+        return SolveResult("solved", [board.to_grid()], stats, "Unique solution")
+
+    line_type, index, candidates = _best_branch_line(board, row_clues, col_clues)
+    nworkers = min(workers, os.cpu_count() or 1, len(candidates))
+    if nworkers < 2:
+        return solve_nonogram(
+            board.to_grid(), row_clues, col_clues, stop_event, progress_cb, max_solutions
+        )
 
-    return best_type, best_index, best_candidates
+    base_grid = board.to_grid()
+    slices = [candidates[i::nworkers] for i in range(nworkers)]
+    solutions: List[List[List[int]]] = []
+    cancelled = False
+    with Manager() as manager:
+        cancel = manager.Event()
+        with ProcessPoolExecutor(max_workers=nworkers) as pool:
+            pending = {
+                pool.submit(
+                    _solve_subtree,
+                    (base_grid, line_type, index, chunk, row_clues, col_clues,
+                     max_solutions, cancel),
+                )
+                for chunk in slices
+            }
+            while pending:
+                done, pending = wait(pending, timeout=0.1)
+                if stop_event is not None and stop_event.is_set():
+                    cancelled = True
+                    cancel.set()
+                for fut in done:
+                    status, sols, nodes, iterations, max_depth = fut.result()
+                    stats.nodes += nodes
+                    stats.iterations += iterations
+                    stats.max_depth = max(stats.max_depth, max_depth + 1)
+                    if status == "cancelled":
+                        cancelled = True
+                    solutions.extend(sols)
+                    if len(solutions) >= max_solutions:
+                        cancel.set()
+
+    if cancelled and len(solutions) < max_solutions:
+        return SolveResult("cancelled", [], stats, "Solve cancelled")
+    if not solutions:
+        return SolveResult("unsolved", [], stats, "No solution")
+    if len(solutions) >= 2:
+        return SolveResult("multiple", solutions[:2], stats, "Multiple solutions found")
+    return SolveResult("solved", solutions, stats, "Unique solution")
 
 
 def solve_nonogram(
@@ -260,45 +890,97 @@ def solve_nonogram(
     stop_event=None,
     progress_cb: Optional[Callable[[str, SolveStats], None]] = None,
     max_solutions: int = 2,
+    workers: Optional[int] = None,
 ) -> SolveResult:
+    height = len(grid)
     width = len(grid[0])
+    full_row = (1 << width) - 1
+    full_col = (1 << height) - 1
+
+    # Parallel search pays off once the board is big enough for the root
+    # branch subtrees to dominate; small boards stay on the serial path.
+    if workers is not None and workers > 1 and height * width >= 400:
+        return _solve_parallel(
+            grid, row_clues, col_clues, stop_event, progress_cb, max_solutions, workers
+        )
+
     solutions: List[List[List[int]]] = []
     stats = SolveStats()
 
-    def dfs(cur_grid: List[List[int]], depth: int) -> None:
+    board = _Board.from_grid(grid)
+    # Dead-end board states seen during this solve. Different branch orders
+    # can reach the same state, and re-propagating it would re-derive the
+    # same contradiction; the full row masks key the outcome exactly, so
+    # the lookup is sound. Insertion order doubles as LRU for eviction.
+    nogoods: OrderedDict = OrderedDict()
+
+    def visit(depth: int, dirty_rows: Optional[int], dirty_cols: Optional[int]):
+        # Propagate one node; return a branch frame to push, or None when
+        # the node is a leaf (contradiction, solution, or nothing to try).
         _check_cancel(stop_event)
         stats.nodes += 1
         stats.max_depth = max(stats.max_depth, depth)
 
-        ok, pstats = propagate(cur_grid, row_clues, col_clues, stop_event, progress_cb)
+        key = (tuple(board.row_filled), tuple(board.row_empty))
+        if key in nogoods:
+            nogoods.move_to_end(key)
+            return None
+
+        ok, pstats = _propagate_board(
+            board, row_clues, col_clues, stop_event, progress_cb, dirty_rows, dirty_cols
+        )
         stats.iterations += pstats.iterations
-        stats.fixed_cells = _count_fixed(cur_grid)
+        stats.fixed_cells = board.count_fixed()
         if not ok:
-            return
+            nogoods[key] = None
+            if len(nogoods) > _NOGOOD_CAP:
+                nogoods.popitem(last=False)
+            return None
 
-        if _is_solved(cur_grid):
-            solutions.append([row[:] for row in cur_grid])
-            return
+        if board.is_solved():
+            solutions.append(board.to_grid())
+            return None
 
-        line_type, index, candidates = _best_branch_line(cur_grid, row_clues, col_clues)
+        line_type, index, candidates = _best_branch_line(board, row_clues, col_clues)
         if not candidates:
-            return
-
-        for cand in candidates:
-            if len(solutions) >= max_solutions:
-                return
-            new_grid = [row[:] for row in cur_grid]
+            return None
+        # The mark is taken after this node's propagation, so rolling back
+        # to it erases exactly one sibling subtree's writes.
+        return depth, line_type, index, iter(candidates), board.checkpoint()
+
+    # Explicit work stack instead of recursion: no Python frame setup per
+    # node and no recursion-limit ceiling on deep searches. Each entry is a
+    # live iterator over one node's branch candidates; advancing it first
+    # rolls the trail back to the node's mark, then applies the candidate
+    # in place. Popped frames leave their last subtree's writes on the
+    # trail for the parent's next rollback to clear.
+    _cancel_state.event = stop_event
+    try:
+        frame = visit(0, None, None)
+        stack = [frame] if frame else []
+        while stack and len(solutions) < max_solutions:
+            depth, line_type, index, candidates, mark = stack[-1]
+            cand = next(candidates, None)
+            if cand is None:
+                stack.pop()
+                continue
+            board.rollback(mark)
+            # The node is at a fixed point, so only the lines crossing the
+            # newly assigned cells need re-solving in the child.
             if line_type == "row":
-                for c in range(width):
-                    new_grid[index][c] = cand[c]
+                filled = board.row_filled[index]
+                empty = board.row_empty[index]
+                add = (cand & ~filled) | ((full_row ^ cand) & ~empty)
+                board.apply_row(index, cand & ~filled, (full_row ^ cand) & ~empty)
+                frame = visit(depth + 1, 0, add)
             else:
-                for r in range(len(new_grid)):
-                    new_grid[r][index] = cand[r]
-            dfs(new_grid, depth + 1)
-
-    try:
-        start_grid = [row[:] for row in grid]
-        dfs(start_grid, 0)
+                filled = board.col_filled[index]
+                empty = board.col_empty[index]
+                add = (cand & ~filled) | ((full_col ^ cand) & ~empty)
+                board.apply_col(index, cand & ~filled, (full_col ^ cand) & ~empty)
+                frame = visit(depth + 1, add, 0)
+            if frame:
+                stack.append(frame)
     except Cancelled:
         return SolveResult(
             status="cancelled",
@@ -306,6 +988,8 @@ def solve_nonogram(
             stats=stats,
             message="Solve cancelled",
         )
+    finally:
+        _cancel_state.event = None
 
     if not solutions:
         return SolveResult(